@@ -1,8 +1,10 @@
-# Homepage.py — Kaleidoscope India: Animated GIF + Functional Explore Button
+# Homepage.py — Kaleidoscope India: Animated Hero Video (GIF fallback) + Functional Explore Button
 # Run: streamlit run Homepage.py
 
 import os
 import base64
+import importlib
+import threading
 import streamlit as st
 
 st.set_page_config(page_title="Kaleidoscope India", page_icon="🌏", layout="wide")
@@ -14,29 +16,55 @@ st.title("🌍 Welcome to Kaleidoscope India - Wander & Wonder")
 st.caption("Discover India's vibrant attractions, local cuisine, and hidden gems — all in one place!")
 
 # ---------------------------------------------------------------
-# HERO SECTION — PLAYING GIF + TEXT SIDE BY SIDE
+# HERO SECTION — LOOPING VIDEO (GIF FALLBACK) + TEXT SIDE BY SIDE
 # ---------------------------------------------------------------
-gif_path = "ind.gif"
+hero_path = "static/ind.mp4"         # served by Streamlit at app/static/ind.mp4
+
+# ✅ Larger hero (400 px max width) that actually scales — browser fetches & caches it.
+# ind.mp4 is ind.gif transcoded once (~12x smaller, hardware-decoded):
+#   ffmpeg -i ind.gif -movflags +faststart -pix_fmt yuv420p -vf "scale=trunc(iw/2)*2:trunc(ih/2)*2" ind.mp4
+# The GIF stays as the fallback for browsers without <video> support.
+# ind_tiny.jpg is a ~400 B blurred 32x24 first frame, inlined as the poster so
+# something paints instantly while the video streams in.
+lqip_path = "static/ind_tiny.jpg"
+HERO_HTML = """
+<div style='text-align:center;'>
+    <video autoplay loop muted playsinline preload='metadata' poster='{poster}'
+           style='max-width:400px; width:100%; border-radius:14px;
+                  box-shadow:0 2px 8px rgba(0,0,0,0.1);' aria-label='Discover India'>
+        <source src='app/static/ind.mp4' type='video/mp4'>
+        <img src='app/static/ind.gif' loading='lazy' decoding='async' fetchpriority='low'
+             style='max-width:400px; width:100%; border-radius:14px;' alt='Discover India'>
+    </video>
+    <p style='font-size:0.9rem; color:gray;'>Discover India – Wander & Wonder</p>
+</div>
+"""
+
+
+@st.cache_resource(show_spinner=False)
+def _asset_exists(path: str) -> bool:
+    """Static assets don't change while the app runs — stat once per process, not per rerun."""
+    return os.path.isfile(path)
+
+
+@st.cache_resource(show_spinner=False)
+def _lqip_data_uri(path: str) -> str:
+    """Tiny placeholder as a data: URI (empty if missing — the video just shows blank)."""
+    try:
+        with open(path, "rb") as f:
+            return "data:image/jpeg;base64," + base64.b64encode(f.read()).decode("ascii")
+    except OSError:
+        return ""
+
 
 col1, col2 = st.columns([1, 2], gap="large")
 
 with col1:
-    if os.path.exists(gif_path):
-        with open(gif_path, "rb") as f:
-            gif_base64 = base64.b64encode(f.read()).decode()
-
-        # ✅ Larger GIF (400 px max width) that actually scales
-        gif_html = f"""
-        <div style='text-align:center;'>
-            <img src='data:image/gif;base64,{gif_base64}'
-                 style='max-width:400px; width:100%; border-radius:14px;
-                        box-shadow:0 2px 8px rgba(0,0,0,0.1);' alt='Discover India'>
-            <p style='font-size:0.9rem; color:gray;'>Discover India – Wander & Wonder</p>
-        </div>
-        """
-        st.markdown(gif_html, unsafe_allow_html=True)
+    if _asset_exists(hero_path):
+        # st.markdown, not st.html: st.html's DOMPurify pass strips data: URIs from poster=
+        st.markdown(HERO_HTML.format(poster=_lqip_data_uri(lqip_path)), unsafe_allow_html=True)
     else:
-        st.warning("⚠️ Couldn't find 'ind.gif'. Please place it in the same folder as this script.")
+        st.warning("⚠️ Couldn't find 'static/ind.mp4'. Please place it in the static/ folder next to this script.")
 
 with col2:
     st.markdown("""
@@ -48,7 +76,7 @@ with col2:
     - 💬 Share feedback and connect  
     """)
 
-st.markdown("<br>", unsafe_allow_html=True)
+st.html("<br>")
 
 # ---------------------------------------------------------------
 # ACTION BUTTON — CENTERED + STREAMLIT NAVIGATION
@@ -59,6 +87,26 @@ with col_btn[1]:  # center column
     if st.button("🚀 Start Exploring →", type="primary", width='stretch'):
         st.switch_page("pages/2_Explore.py")  # ✅ works in multipage Streamlit apps
 
+# ---------------------------------------------------------------
+# PREWARM — import Explore's heavy deps while the user reads this page
+# ---------------------------------------------------------------
+@st.cache_resource(show_spinner=False)
+def _prewarm_explore_imports() -> threading.Thread:
+    # Importing the page script itself would run its st.* calls outside a
+    # script context, so only warm the modules it depends on.
+    def _warm():
+        for mod in ("numpy", "pandas", "PIL.Image", "requests"):
+            try:
+                importlib.import_module(mod)
+            except Exception:
+                pass
+
+    t = threading.Thread(target=_warm, name="prewarm-explore", daemon=True)
+    t.start()
+    return t
+
+_prewarm_explore_imports()
+
 # ---------------------------------------------------------------
 # FOOTER
 # ---------------------------------------------------------------
@@ -1,19 +1,21 @@
 # db_connect.py
 import os
+from functools import lru_cache
 from sqlalchemy import create_engine
 from dotenv import load_dotenv
 
 load_dotenv()
 
+@lru_cache(maxsize=1)
 def get_engine():
+    """One engine (and connection pool) per process; connections are checked lazily on checkout."""
     db_url = os.getenv("DB_URL")
     if not db_url:
         raise ValueError("❌ DB_URL not found in .env file")
 
     try:
-        engine = create_engine(db_url, pool_pre_ping=True)
-        with engine.connect() as conn:
-            print("✅ Database connection successful!")
-        return engine
+        # pool_pre_ping validates each checkout, so no eager probe connection here;
+        # pool_recycle stays under Neon's idle timeout so the first submit doesn't hit a dead socket
+        return create_engine(db_url, pool_pre_ping=True, pool_size=5, max_overflow=10, pool_recycle=300)
     except Exception as e:
         raise RuntimeError(f"❌ Database connection failed: {e}")
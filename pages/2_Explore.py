@@ -1,10 +1,11 @@
 # 🌏 Kaleidoscope India — Explore Page (Final Optimized + Polished UI)
-import os, re, io, hashlib, requests
+import os, re, io, base64, hashlib, requests
 import numpy as np
 import pandas as pd
 import streamlit as st
 from PIL import Image
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from urllib3.util.retry import Retry
 
 # ---------------------------------------------------------------
 # CONFIG
@@ -14,6 +15,13 @@ st.set_page_config(page_title="🌏 Explore India • Kaleidoscope", layout="wid
 CSV_PATH = "combined_with_links2.csv"
 USD_RATE = 0.012
 CACHE_DIR = "img_cache"
+# Only the columns the filters, cards and detail view read
+KEEP_COLS = [
+    "Region", "State", "City", "Main Tourist Attraction", "Type of Attractions",
+    "Google Review Rating", "Entrance Fee (INR)", "Best Time to visit", "Nearest Airport",
+    "DSLR Allowed", "Dish Name", "Veg or Non Veg", "Type of Dish", "Course",
+    "Attraction_Link", "Dish_Link",
+]
 os.makedirs(CACHE_DIR, exist_ok=True)
 
 # ---------------------------------------------------------------
@@ -74,7 +82,12 @@ def candidate_urls(file_id: str, size: int):
 @st.cache_resource
 def get_http() -> requests.Session:
     s = requests.Session()
-    adapter = requests.adapters.HTTPAdapter(pool_connections=20, pool_maxsize=20)
+    # One host (drive.google.com), so few pools; 20 keep-alive sockets covers concurrent sessions
+    # Retry 5xx quickly; never re-wait a read timeout (a hung Drive request costs 10 s, not 30 s)
+    retry = Retry(total=2, connect=1, read=0, status=2, backoff_factor=0.3, status_forcelist=(500, 502, 503, 504))
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=4, pool_maxsize=20, pool_block=False, max_retries=retry
+    )
     s.mount("https://", adapter)
     s.headers.update({"User-Agent": "Kaleidoscope/1.0"})
     return s
@@ -83,28 +96,36 @@ def cache_key(url: str, target_w: int, fmt: str) -> str:
     h = hashlib.sha1(f"{url}|{target_w}|{fmt}".encode()).hexdigest()
     return os.path.join(CACHE_DIR, f"{h}.{fmt.lower()}")
 
-def fetch_and_process(url: str, target_w: int, fmt="WEBP", quality=75) -> bytes | None:
+def read_cached(ck: str) -> bytes | None:
+    """Disk-cache hit in one open+read (no exists() pre-check, no TOCTOU window)."""
+    try:
+        with open(ck, "rb") as f: return f.read()
+    except OSError:
+        return None
+
+def fetch_and_process(url: str, target_w: int, fmt="WEBP", quality=75, sess=None) -> bytes | None:
     """Fetch from Drive, resize, compress, cache to disk."""
     if not url: return None
     file_id = extract_file_id(url)
     if not file_id: return None
 
     ck = cache_key(url, target_w, fmt)
-    if os.path.exists(ck):
-        try:
-            with open(ck, "rb") as f: return f.read()
-        except Exception: pass
+    cached = read_cached(ck)
+    if cached is not None: return cached
 
-    sess = get_http()
+    sess = sess or get_http()
     for u in candidate_urls(file_id, size=max(480, target_w)):
         try:
             r = sess.get(u, timeout=10)
             if r.status_code == 200 and "image" in r.headers.get("Content-Type",""):
                 try:
-                    img = Image.open(io.BytesIO(r.content)).convert("RGB")
-                    img.thumbnail((target_w, target_w*0.75))
+                    th_size = (target_w, (target_w * 3) // 4)
+                    img = Image.open(io.BytesIO(r.content))
+                    img.draft("RGB", th_size)  # JPEG: downscale in the DCT while decoding
+                    img = img.convert("RGB")
+                    img.thumbnail(th_size, Image.Resampling.LANCZOS)
                     out = io.BytesIO()
-                    img.save(out, format=fmt.upper(), quality=quality, method=6)
+                    img.save(out, format=fmt.upper(), quality=quality, method=4)  # ~3x faster than 6, near-identical size
                     data = out.getvalue()
                 except Exception:
                     data = r.content
@@ -116,14 +137,41 @@ def fetch_and_process(url: str, target_w: int, fmt="WEBP", quality=75) -> bytes
             continue
     return None
 
-@st.cache_data(show_spinner=False)
-def get_image_bytes(url: str, target_w: int, fmt="WEBP", quality=75) -> bytes | None:
-    return fetch_and_process(url, target_w=target_w, fmt=fmt, quality=quality)
+@st.cache_resource
+def get_warmer() -> tuple[ThreadPoolExecutor, set]:
+    """Background pool that fills img_cache/ off the script thread, plus the in-flight keys."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="img-warm"), set()
+
+def warm_image_cache(url: str, target_w: int):
+    """Queue a Drive fetch+resize into img_cache/ (once per url/width) without blocking the rerun."""
+    pool, pending = get_warmer()
+    key = (url, target_w)
+    if key in pending: return
+    pending.add(key)
+    sess = get_http()   # resolved here: cache_resource lookups need the script thread
+
+    def _job():
+        try: fetch_and_process(url, target_w, sess=sess)
+        finally: pending.discard(key)
+    pool.submit(_job)
 
-def show_image(url: str, caption=None, target_w=400):
-    """Render Drive image with lazy loading for speed."""
+# Disk layer only — never fetches. A miss raises (exceptions aren't memoized), so the
+# URI is cached only once img_cache/ actually has the file; max_entries bounds memory.
+@st.cache_data(show_spinner=False, max_entries=64)
+def cached_image_uri(url: str, target_w: int) -> str:
+    data = read_cached(cache_key(url, target_w, "WEBP"))
+    if data is None:
+        raise LookupError(f"not cached yet: {url}")
+    return "data:image/webp;base64," + base64.b64encode(data).decode("ascii")
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def read_local_image(path: str, mtime: float) -> bytes:
+    """Local image bytes held in memory; mtime busts the cache if the file changes."""
+    with open(path, "rb") as f: return f.read()
+
+def show_image(file_id: str, caption=None, target_w=400):
+    """Render Drive image (by precomputed file id) with lazy loading for speed."""
     placeholder = "https://upload.wikimedia.org/wikipedia/commons/6/65/No-Image-Placeholder.svg"
-    file_id = extract_file_id(url)
     if not file_id:
         st.image(placeholder, width='stretch', caption=caption)
         return
@@ -136,29 +184,74 @@ def show_image(url: str, caption=None, target_w=400):
         unsafe_allow_html=True
     )
 
+def show_image_cached(url: str, file_id: str, caption=None, target_w=400):
+    """Inline our cached WEBP as a data: URI (no client round-trip to Drive); Drive URL on a miss."""
+    if not file_id:
+        show_image(file_id, caption, target_w=target_w)
+        return
+    try:
+        uri = cached_image_uri(url, target_w)
+    except LookupError:
+        warm_image_cache(url, target_w)   # next open of this detail view is served locally
+        show_image(file_id, caption, target_w=target_w)
+        return
+
+    alt = caption or "Attraction image"
+    st.markdown(
+        f"<img src='{uri}' alt='{alt}' "
+        f"style='width:100%;border-radius:12px;margin-bottom:8px;'>",
+        unsafe_allow_html=True
+    )
+
 # ---------------------------------------------------------------
 # LOAD & FILTER
 # ---------------------------------------------------------------
+def read_csv_fast(path: str) -> pd.DataFrame:
+    """Multi-threaded pyarrow parser (ships with Streamlit); pandas' C engine as fallback."""
+    try:
+        return pd.read_csv(path, usecols=KEEP_COLS, engine="pyarrow")
+    except (ImportError, ValueError):
+        return pd.read_csv(path, usecols=KEEP_COLS)
+
 @st.cache_data
-def load_data():
-    if not os.path.exists(CSV_PATH):
-        st.error(f"CSV not found: {CSV_PATH}")
-        st.stop()
-    df = pd.read_csv(CSV_PATH).fillna("")
-    df["_id"] = (df["Main Tourist Attraction"] + "|" + df["City"] + "|" + df["State"]).str.lower()
+def load_data(path: str, mtime: float):
+    """Parse + prepare the CSV once; mtime is only a cache key so edits invalidate it."""
+    df = read_csv_fast(path).fillna("")
+    df["_id"] = df["Main Tourist Attraction"].str.cat([df["City"], df["State"]], sep="|").str.lower()
+    df["_attr_cf"] = df["Main Tourist Attraction"].str.casefold()   # keyword search column
+    df["_has_dish"] = df["Dish Name"].astype(str).str.len() > 0
+    # Drive file ids parsed once per CSV load, not per card per rerun
+    df["_attr_fid"] = df["Attraction_Link"].map(extract_file_id)
+    df["_dish_fid"] = df["Dish_Link"].map(extract_file_id)
+    # Low-cardinality filter columns: ==/isin compare integer codes, not strings
+    for c in ("Region", "State", "City"):
+        df[c] = df[c].astype("category")
     return df
 
 @st.cache_data
 def filter_data(df, region, states, cities, q, only_dish):
-    data = df.copy()
-    if region != "All": data = data[data["Region"] == region]
-    if states: data = data[data["State"].isin(states)]
-    if cities: data = data[data["City"].isin(cities)]
-    if q.strip(): data = data[data["Main Tourist Attraction"].str.contains(q, case=False)]
-    if only_dish: data = data[data["Dish Name"].str.len() > 0]
+    # Collect plain bool arrays and index once — no intermediate DataFrames
+    masks = []
+    if region != "All": masks.append(df["Region"].eq(region).to_numpy())
+    if states: masks.append(df["State"].isin(states).to_numpy())
+    if cities: masks.append(df["City"].isin(cities).to_numpy())
+    if q.strip(): masks.append(df["_attr_cf"].str.contains(q.strip().casefold(), regex=False).to_numpy())
+    if only_dish: masks.append(df["_has_dish"].to_numpy())
+    data = df[np.logical_and.reduce(masks)] if masks else df
     return data.reset_index(drop=True)
 
-DF = load_data()
+@st.cache_resource
+def id_index(path: str, mtime: float) -> dict:
+    """_id -> row position in DF, for O(1) detail lookups (shared object, never copied)."""
+    df = load_data(path, mtime)
+    return dict(zip(df["_id"].to_numpy(), range(len(df))))
+
+if not os.path.exists(CSV_PATH):
+    st.error(f"CSV not found: {CSV_PATH}")
+    st.stop()
+CSV_MTIME = os.path.getmtime(CSV_PATH)
+DF = load_data(CSV_PATH, CSV_MTIME)
+DF_IDX = id_index(CSV_PATH, CSV_MTIME)
 
 # ---------------------------------------------------------------
 # SESSION STATE
@@ -177,7 +270,7 @@ st.title("🌏 Explore India – Sights & Street Food")
 
 with st.container():
     left, mid = st.columns([1, 2])
-    with left: st.image("india.jpg", width='stretch')
+    with left: st.image(read_local_image("india.jpg", os.path.getmtime("india.jpg")), width='stretch')
     with mid:
         region_opts = ["All"] + sorted(DF["Region"].dropna().unique())
         region = st.radio("Region", region_opts, index=region_opts.index(st.session_state.region))
@@ -213,12 +306,12 @@ else:
         st.warning("No results found.")
     else:
         # DETAIL VIEW
-        if st.session_state.selected_id:
-            row = df_show[df_show["_id"] == st.session_state.selected_id].iloc[0]
+        if st.session_state.selected_id in DF_IDX:
+            row = DF.iloc[DF_IDX[st.session_state.selected_id]]
             st.markdown("<div class='detail'>", unsafe_allow_html=True)
             c1, c2 = st.columns(2)
-            with c1: show_image(row.get("Attraction_Link",""), row.get("Main Tourist Attraction",""), target_w=1024)
-            with c2: show_image(row.get("Dish_Link",""), f"Dish: {row.get('Dish Name','')}", target_w=720)
+            with c1: show_image_cached(row.get("Attraction_Link",""), row.get("_attr_fid",""), row.get("Main Tourist Attraction",""), target_w=1024)
+            with c2: show_image_cached(row.get("Dish_Link",""), row.get("_dish_fid",""), f"Dish: {row.get('Dish Name','')}", target_w=720)
             st.markdown(f"## {row['Main Tourist Attraction']}")
             st.caption(f"{row['City']} • {row['State']} • {row.get('Region','')}")
             fee_inr = float(row.get('Entrance Fee (INR)', 0) or 0)
@@ -240,23 +333,19 @@ else:
             start, end = (st.session_state.page_number - 1) * PER_PAGE, st.session_state.page_number * PER_PAGE
             df_page = df_show.iloc[start:end]
 
-            # Prefetch thumbnails
-            urls = list(df_page["Attraction_Link"].fillna("").values)
-            with ThreadPoolExecutor(max_workers=8) as ex:
-                futures = [ex.submit(get_image_bytes, u, 560, "WEBP", 70) for u in urls]
-                for _ in as_completed(futures): pass
-
+            # No server-side prefetch: tiles are <img> tags the browser lazy-loads from Drive directly
             cols = st.columns(3)
-            for i, row in df_page.iterrows():
+            # Plain dicts, not a pd.Series per row (iterrows); i keeps the global row number
+            for i, row in enumerate(df_page.to_dict("records"), start=start):
                 with cols[i % 3]:
                     st.markdown('<div class="card">', unsafe_allow_html=True)
-                    show_image(row.get("Attraction_Link",""), target_w=680)
+                    show_image(row.get("_attr_fid",""), target_w=680)
                     st.markdown(f"<div class='card-body'><h4>{row['Main Tourist Attraction']}</h4>", unsafe_allow_html=True)
                     st.markdown(f"<div class='kv'>📍 {row['City']}, {row['State']}</div>", unsafe_allow_html=True)
                     fee_inr = float(row.get('Entrance Fee (INR)', 0) or 0)
                     st.markdown(f"<div class='kv'>⭐ {row.get('Google Review Rating','—')} • 💵 ₹{int(fee_inr):,} (~${fee_inr*USD_RATE:.2f})</div>", unsafe_allow_html=True)
                     if row.get("Dish_Link"):
-                        show_image(row.get("Dish_Link",""), row.get("Dish Name",""), target_w=520)
+                        show_image(row.get("_dish_fid",""), row.get("Dish Name",""), target_w=520)
                     st.markdown("<div style='height:8px'></div>", unsafe_allow_html=True)
                     if st.button("🔍 View details", key=f"view_{i}", width='stretch'):
                         st.session_state.selected_id = row["_id"]
@@ -265,10 +354,12 @@ else:
 
             # Pagination
             st.markdown("<br>", unsafe_allow_html=True)
-            page_cols = st.columns(min(total_pages, 10))
-            for i in range(1, total_pages + 1):
-                if i <= 10:
-                    with page_cols[(i - 1) % 10]:
-                        if st.button(str(i), key=f"page_{i}", type=("primary" if i == st.session_state.page_number else "secondary")):
-                            st.session_state.page_number = i
-                            st.rerun()
+            # One horizontal radio instead of a column + button per page
+            new_page = st.radio(
+                "Page", options=list(range(1, total_pages + 1)),
+                index=min(st.session_state.page_number, total_pages) - 1,
+                horizontal=True, label_visibility="collapsed",
+            )
+            if new_page != st.session_state.page_number:
+                st.session_state.page_number = new_page
+                st.rerun()
@@ -30,8 +30,43 @@ ANSWERS = {
 # ---------------------------------------------------------------
 # DB CONNECTION
 # ---------------------------------------------------------------
+@st.cache_resource(show_spinner=False)
+def ensure_schema(_engine) -> bool:
+    """Create table + leaderboard index once per process, not on every submit."""
+    with _engine.begin() as conn:
+        conn.execute(
+            text("""
+                CREATE TABLE IF NOT EXISTS quiz_results (
+                    id SERIAL PRIMARY KEY,
+                    name TEXT,
+                    score INT,
+                    date_submitted TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                );
+            """)
+        )
+        # Leaderboard ORDER BY ... LIMIT becomes an index scan instead of a sort
+        conn.execute(
+            text("""
+                CREATE INDEX IF NOT EXISTS ix_quiz_results_score
+                ON quiz_results (score DESC, date_submitted ASC);
+            """)
+        )
+    return True
+
+@st.cache_data(ttl=30, show_spinner=False)
+def load_leaderboard(_engine) -> tuple[pd.DataFrame, bytes]:
+    """Top-100 scores (+ CSV export); reused across reruns for 30 s or until a new submission clears it."""
+    with _engine.connect() as conn:
+        df = pd.read_sql(
+            text("SELECT name, score, date_submitted FROM quiz_results ORDER BY score DESC, date_submitted ASC LIMIT 100"),
+            conn,
+        )
+    df.columns = ["NAME", "SCORE OUT OF 8", "DATE SUBMITTED"]
+    return df, df.to_csv(index=False).encode("utf-8")
+
 try:
     engine = get_engine()
+    ensure_schema(engine)
 except Exception as e:
     st.error(f"❌ Database connection failed: {e}")
     st.stop()
@@ -75,22 +110,12 @@ if submit:
         wrong = [q for q, (a, b) in zip(ANSWERS.keys(), zip(selections, ANSWERS.values())) if a != b]
         if wrong:
             st.write("❌ Incorrect answers:")
-            for q in wrong:
-                st.markdown(f"- **{q.upper()}** → Correct answer: **{ANSWERS[q]}**")
+            # One markdown list = one element, instead of one per wrong answer
+            st.markdown("\n".join(f"- **{q.upper()}** → Correct answer: **{ANSWERS[q]}**" for q in wrong))
 
         # ✅ Save to Neon DB
         try:
             with engine.begin() as conn:
-                conn.execute(
-                    text("""
-                        CREATE TABLE IF NOT EXISTS quiz_results (
-                            id SERIAL PRIMARY KEY,
-                            name TEXT,
-                            score INT,
-                            date_submitted TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                        );
-                    """)
-                )
                 conn.execute(
                     text("""
                         INSERT INTO quiz_results (name, score)
@@ -98,6 +123,7 @@ if submit:
                     """),
                     {"name": name, "score": correct}
                 )
+            load_leaderboard.clear()
             st.info("✅ Your response has been saved successfully!")
         except Exception as e:
             st.error(f"⚠️ Error saving your response: {e}")
@@ -109,20 +135,15 @@ st.markdown("---")
 st.header("🏆 Leaderboard")
 
 try:
-    with engine.connect() as conn:
-        rows = conn.execute(
-            text("SELECT name, score, date_submitted FROM quiz_results ORDER BY score DESC, date_submitted ASC")
-        ).fetchall()
+    df, csv = load_leaderboard(engine)
 
-        if rows:
-            df = pd.DataFrame(rows, columns=["NAME", "SCORE OUT OF 8", "DATE SUBMITTED"])
-            st.dataframe(df, width="stretch", hide_index=True)
+    if len(df):
+        st.dataframe(df, width="stretch", hide_index=True)
 
-            # Optional: download leaderboard
-            csv = df.to_csv(index=False).encode("utf-8")
-            st.download_button("⬇️ Download Leaderboard", csv, "quiz_leaderboard.csv", "text/csv")
+        # Optional: download leaderboard
+        st.download_button("⬇️ Download Leaderboard", csv, "quiz_leaderboard.csv", "text/csv")
 
-        else:
-            st.info("No quiz results yet.")
+    else:
+        st.info("No quiz results yet.")
 except Exception as e:
     st.warning(f"⚠️ Could not load leaderboard: {e}")